@@ -5,14 +5,23 @@ Uses LLM-based classification to accurately detect fundraising events.
 Optionally runs MENA market analysis on each article.
 """
 
-import feedparser
-from datetime import datetime, timedelta
+from xml.etree import ElementTree
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from dateutil import parser as date_parser
 import re
 import os
+import sys
 import json
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+import asyncio
+import functools
+import hashlib
+import importlib.util
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from typing import Optional, List, Dict, Any, Tuple
 
 # Load .env file if present
 try:
@@ -21,22 +30,26 @@ try:
 except ImportError:
     pass  # dotenv not installed, rely on environment variables
 
-# Try to import OpenAI - optional dependency
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# Heavy optional dependencies (openai, requests, bs4, httpx) are only
+# located here and imported on first use, keeping startup and --help fast
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
+if not OPENAI_AVAILABLE:
     print("Note: OpenAI not installed. Using keyword-based detection.")
     print("Install with: pip install openai\n")
 
-# Try to import requests and BeautifulSoup for web scraping
-try:
-    import requests
-    from bs4 import BeautifulSoup
-    SCRAPING_AVAILABLE = True
-except ImportError:
-    SCRAPING_AVAILABLE = False
+# orjson is a faster drop-in for parsing LLM responses and writing exports -
+# optional dependency, imported on first use like the ones above
+ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
+
+# requests and BeautifulSoup are needed for web scraping
+SCRAPING_AVAILABLE = all(importlib.util.find_spec(name) for name in ("requests", "bs4"))
+
+# lxml is a much faster HTML parser than the stdlib one, when installed
+HTML_PARSER = 'lxml' if importlib.util.find_spec("lxml") else 'html.parser'
+
+# httpx (installed with openai) fetches articles concurrently; HTTP/2 needs h2
+HTTPX_AVAILABLE = importlib.util.find_spec("httpx") is not None
+HTTP2_AVAILABLE = HTTPX_AVAILABLE and importlib.util.find_spec("h2") is not None
 
 
 # RSS feeds focused on AI/startup funding
@@ -72,6 +85,67 @@ FEEDS = [
     ("Bloomberg Tech", "https://feeds.bloomberg.com/technology/news.rss"),
 ]
 
+# Number of feeds fetched concurrently
+FEED_FETCH_WORKERS = 8
+
+# Article pages fetched concurrently for MENA analysis
+ARTICLE_FETCH_CONCURRENCY = 16
+
+# Retries for feed and article requests that fail to connect or get a
+# rate-limit/server error, with exponential backoff starting at HTTP_RETRY_BACKOFF seconds
+HTTP_RETRIES = 2
+HTTP_RETRY_BACKOFF = 0.3
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Selectors tried in order to find an article's main text
+ARTICLE_SELECTORS = [
+    'article',
+    '[role="main"]',
+    '.article-content',
+    '.post-content',
+    '.entry-content',
+    '.story-body',
+    '.article-body',
+    'main',
+    '.content'
+]
+
+# Seconds to wait on a feed download
+FEED_TIMEOUT = 15
+
+# Browser User-Agent for feed and article requests; some sites block library defaults
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Articles sent per LLM classification request
+CLASSIFICATION_BATCH_SIZE = 15
+
+# Cap on in-flight OpenAI requests (and article fetches feeding them). At
+# least 1, since a zero-slot semaphore would hang every LLM step; a value
+# that isn't an integer falls back to the default
+try:
+    OPENAI_MAX_CONCURRENCY = max(1, int(os.getenv("OPENAI_MAX_CONCURRENCY", "8")))
+except ValueError:
+    OPENAI_MAX_CONCURRENCY = 8
+
+# Chat model for classification and MENA analysis, read once at startup
+MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+
+# Seconds between status checks on a submitted OpenAI Batch API job
+BATCH_POLL_INTERVAL = 30
+
+# Attempts at each Batch API status or file download call before giving up
+BATCH_API_ATTEMPTS = 5
+
+# Rules separating sections of the text report and MENA console output
+SEP_EQ = "=" * 80
+SEP_DASH = "-" * 40
+
+# Write buffer for exported reports, large enough to hand the OS one write
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# On-disk cache of LLM results, shared across runs
+CACHE_PATH = os.getenv("MENA_SIGNAL_CACHE", "cache.db")
+
 # Keywords that indicate funding news (fallback when LLM not available)
 FUNDING_KEYWORDS = [
     "raises", "raised", "funding", "series a", "series b", "series c", "series d",
@@ -85,6 +159,38 @@ NEGATIVE_KEYWORDS = [
     "what is", "explainer", "analysis:", "podcast", "interview"
 ]
 
+# Keyword lists compiled into single case-insensitive scanners. Only a
+# leading word boundary is required, so "round" no longer fires on "around"
+# while "investor" still matches "investors".
+FUNDING_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, FUNDING_KEYWORDS)) + ')', re.IGNORECASE)
+NEGATIVE_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, NEGATIVE_KEYWORDS)) + ')', re.IGNORECASE)
+
+# Funding amounts like "$50M", "$1.2 billion" or "30 million"
+AMOUNT_RE = re.compile(r'(?P<dollar>\$)?(?P<num>\d+(?:\.\d+)?)\s*(?P<unit>million|billion|m\b|b\b)', re.IGNORECASE)
+
+# Titles sharing at least this fraction of their distinctive words are
+# treated as one story
+TITLE_SIMILARITY_THRESHOLD = 0.7
+TITLE_TOKEN_RE = re.compile(r'\w+(?:\.\d+)?')
+# Shorter titles share too few words for the similarity ratio to mean anything
+TITLE_MIN_TOKENS = 3
+
+# Words every funding headline shares, dropped before titles are compared so
+# "AI startup Foo raises $5M seed round" and "AI startup Bar raises $5M seed
+# round" come down to {foo} and {bar}. Funding keywords and amounts are
+# dropped too.
+TITLE_STOP_WORDS = frozenset([
+    "a", "an", "the", "and", "or", "of", "to", "in", "on", "for", "with", "by",
+    "at", "from", "as", "its", "is", "led", "new", "ai", "startup", "startups",
+    "company", "exclusive", "report", "says", "m", "b", "mn", "bn", "usd", "us",
+] + [word for keyword in FUNDING_KEYWORDS for word in keyword.split()])
+
+# Atom elements rank with plain RSS ones when reading feed entries
+ATOM_NAMESPACE = '{http://www.w3.org/2005/Atom}'
+
+# Compiled once; clean_html runs on every feed entry
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+
 
 @dataclass
 class FundingClassification:
@@ -95,9 +201,10 @@ class FundingClassification:
     amount: Optional[str] = None
     round_type: Optional[str] = None
     reasoning: Optional[str] = None
+    method: str = "llm"  # llm or keywords; only LLM results are cached
 
 
-@dataclass
+@dataclass(slots=True)
 class MENAAnalysis:
     """Result of MENA market analysis."""
     # 1. Summary
@@ -130,6 +237,110 @@ class MENAAnalysis:
     
     # 6. Justification
     justification: str
+    
+    # Display strings joined once from the lists above; not part of the cache
+    target_sectors_str: str = field(init=False, repr=False, compare=False)
+    potential_buyers_str: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.target_sectors_str = ', '.join(self.target_sectors)
+        self.potential_buyers_str = ', '.join(self.potential_buyers)
+    
+    def as_export_dict(self) -> Dict[str, Any]:
+        """Nested dict for this analysis in the JSON export."""
+        return {
+            'innovation_summary': self.innovation_summary,
+            'innovation_type': self.innovation_type,
+            'problem_solution_fit': self.problem_solution_fit,
+            'target_sectors': self.target_sectors,
+            'vision_2030_alignment': self.vision_2030_alignment,
+            'localizability': {
+                'arabic_complexity': self.arabic_complexity,
+                'arabic_notes': self.arabic_complexity_notes,
+                'regulatory_fit': self.regulatory_fit,
+                'regulatory_notes': self.regulatory_fit_notes,
+                'market_readiness': self.market_readiness,
+                'market_notes': self.market_readiness_notes,
+                'infrastructure_fit': self.infrastructure_fit,
+                'infrastructure_notes': self.infrastructure_fit_notes
+            },
+            'commercial': {
+                'potential_buyers': self.potential_buyers,
+                'sales_motion': self.sales_motion
+            },
+            'opportunity': {
+                'commercialization_potential': self.commercialization_potential,
+                'localization_requirement': self.localization_requirement,
+                'priority': self.priority
+            },
+            'justification': self.justification
+        }
+
+
+class LLMResultCache:
+    """SQLite-backed cache of LLM classification and MENA analysis results.
+    
+    Overlapping feeds and repeated runs see the same articles again; a hit
+    here saves an LLM call. Keys include the model and prompt digests
+    (CLASSIFICATION_CACHE_VERSION, MENA_CACHE_VERSION), so stale answers
+    are never served after either changes. Cache errors are treated as misses.
+    
+    Every access comes from the asyncio event loop's thread, so the one
+    connection needs no lock. The sqlite calls are synchronous and do run
+    on the event loop; each is a primary-key lookup or a single-row WAL
+    write, far shorter than the network requests they save.
+    """
+    
+    def __init__(self, path: str = CACHE_PATH):
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS cls (key TEXT PRIMARY KEY, data TEXT, ts INTEGER)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS mena (key TEXT PRIMARY KEY, data TEXT, ts INTEGER)")
+        self._conn.commit()
+    
+    @staticmethod
+    def _key(*parts: str) -> str:
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+    
+    def _get(self, table: str, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            row = self._conn.execute(f"SELECT data FROM {table} WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error:
+            return None
+        return json.loads(row[0]) if row else None
+    
+    def _set(self, table: str, key: str, data: Dict[str, Any]):
+        try:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {table} (key, data, ts) VALUES (?, ?, ?)",
+                (key, json.dumps(data), int(time.time()))
+            )
+            self._conn.commit()
+        except sqlite3.Error:
+            pass
+    
+    def get_classification(self, title: str, link: str) -> Optional[FundingClassification]:
+        data = self._get("cls", self._key(CLASSIFICATION_CACHE_VERSION, title, link))
+        try:
+            return FundingClassification(**data) if data else None
+        except TypeError:
+            return None  # Stored with an older schema
+    
+    def set_classification(self, title: str, link: str, classification: FundingClassification):
+        self._set("cls", self._key(CLASSIFICATION_CACHE_VERSION, title, link), asdict(classification))
+    
+    def get_mena(self, link: str, content: str) -> Optional[MENAAnalysis]:
+        data = self._get("mena", self._key(MENA_CACHE_VERSION, link, content[:1000]))
+        try:
+            return MENAAnalysis(**data) if data else None
+        except TypeError:
+            return None  # Stored with an older schema
+    
+    def set_mena(self, link: str, content: str, analysis: MENAAnalysis):
+        data = asdict(analysis)
+        # Derived fields are rebuilt by __post_init__ on load
+        del data['target_sectors_str'], data['potential_buyers_str']
+        self._set("mena", self._key(MENA_CACHE_VERSION, link, content[:1000]), data)
 
 
 # MENA Analysis Prompt
@@ -168,10 +379,8 @@ Provide your analysis as a JSON object with the following structure:
 Respond with ONLY the JSON object, no other text."""
 
 
-# LLM Classification prompt - using double braces to escape JSON example
-CLASSIFICATION_PROMPT = """You are a financial news classifier. Analyze the following news headline and summary to determine if it's about a STARTUP FUNDRAISING EVENT.
-
-A fundraising event includes:
+# Shared definition of a fundraising event for the classification prompts
+CLASSIFICATION_CRITERIA = """A fundraising event includes:
 - Seed rounds, Series A/B/C/D rounds
 - Venture capital investments
 - Private equity investments in startups
@@ -184,7 +393,13 @@ NOT a fundraising event:
 - Government grants or subsidies
 - Layoffs or company shutdowns
 - Opinion pieces or analysis articles
-- How-to guides or tutorials
+- How-to guides or tutorials"""
+
+
+# LLM Classification prompt - using double braces to escape JSON example
+CLASSIFICATION_PROMPT = """You are a financial news classifier. Analyze the following news headline and summary to determine if it's about a STARTUP FUNDRAISING EVENT.
+
+""" + CLASSIFICATION_CRITERIA + """
 
 Respond with a JSON object:
 {{
@@ -203,28 +418,133 @@ NEWS SUMMARY: {summary}
 JSON Response:"""
 
 
-def classify_with_llm(title: str, summary: str, client: "OpenAI", verbose: bool = False, debug: bool = False) -> FundingClassification:
+# Batched variant: several articles per request so the instructions are sent once
+BATCH_CLASSIFICATION_PROMPT = """You are a financial news classifier. Analyze each of the following numbered news articles to determine if it's about a STARTUP FUNDRAISING EVENT.
+
+""" + CLASSIFICATION_CRITERIA + """
+
+Respond with a JSON object holding one result per article:
+{{
+    "results": [
+        {{
+            "index": article number,
+            "is_fundraising": true/false,
+            "confidence": 0.0-1.0,
+            "company_name": "extracted company name or null",
+            "amount": "funding amount like '$50M' or null",
+            "round_type": "Seed/Series A/Series B/etc or null",
+            "reasoning": "brief 1-sentence explanation"
+        }}
+    ]
+}}
+
+ARTICLES:
+{articles}
+
+JSON Response:"""
+
+# System messages are identical on every request, so build them once
+SYSTEM_MSG_CLASSIFY = {
+    "role": "system",
+    "content": "You are a precise financial news classifier. Respond ONLY with a compact JSON object on a single line, no other text."
+}
+SYSTEM_MSG_CLASSIFY_BATCH = {
+    "role": "system",
+    "content": "You are a precise financial news classifier. Respond ONLY with a JSON object, no other text."
+}
+SYSTEM_MSG_MENA = {
+    "role": "system",
+    "content": "You are a venture analyst specializing in MENA markets. Respond only with valid JSON."
+}
+
+# Cached results are keyed by the model and a digest of the prompts that
+# produced them, so changing OPENAI_MODEL or editing a prompt starts fresh
+CLASSIFICATION_CACHE_VERSION = hashlib.sha256("\n".join([
+    MODEL, CLASSIFICATION_PROMPT, BATCH_CLASSIFICATION_PROMPT,
+    SYSTEM_MSG_CLASSIFY["content"], SYSTEM_MSG_CLASSIFY_BATCH["content"]
+]).encode("utf-8")).hexdigest()
+MENA_CACHE_VERSION = hashlib.sha256("\n".join([
+    MODEL, MENA_ANALYSIS_PROMPT, SYSTEM_MSG_MENA["content"]
+]).encode("utf-8")).hexdigest()
+
+
+@functools.cache
+def load_async_openai():
+    """Import and return the AsyncOpenAI class on first use."""
+    from openai import AsyncOpenAI
+    return AsyncOpenAI
+
+
+def parse_json(content: str) -> Any:
+    """Parse a JSON-mode LLM response, using orjson when available.
+    
+    Raises json.JSONDecodeError (orjson's error subclasses it) on bad input.
+    """
+    if ORJSON_AVAILABLE:
+        import orjson
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dump_json(data: Any, pretty: bool = False) -> bytes:
+    """Serialize data as UTF-8 JSON, using orjson when available.
+    
+    Output is compact unless pretty is set, which indents by two spaces.
+    """
+    if ORJSON_AVAILABLE:
+        import orjson
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def parse_classification(data: Dict[str, Any]) -> FundingClassification:
+    """Build a FundingClassification from the LLM's JSON fields."""
+    # Handle both snake_case and possible variations
+    is_fund = data.get("is_fundraising", data.get("is_fundraising_event", data.get("fundraising", False)))
+    conf = data.get("confidence", 0.5)
+    
+    return FundingClassification(
+        is_fundraising=bool(is_fund),
+        confidence=float(conf) if conf else 0.5,
+        company_name=data.get("company_name"),
+        amount=data.get("amount"),
+        round_type=data.get("round_type"),
+        reasoning=data.get("reasoning")
+    )
+
+
+async def gather_bounded(coros: List[Any], limit: int = OPENAI_MAX_CONCURRENCY) -> List[Any]:
+    """Await coroutines concurrently, at most `limit` at a time, in input order."""
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def run(coro):
+        async with semaphore:
+            return await coro
+    
+    return await asyncio.gather(*(run(coro) for coro in coros))
+
+
+async def classify_with_llm(title: str, summary: str, client: "AsyncOpenAI", verbose: bool = False, debug: bool = False) -> FundingClassification:
     """Use LLM to classify if news is about a fundraising event."""
     content = ""  # Initialize for error handling
     try:
-        model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-        
         if debug:
             print(f"\n      DEBUG: Calling API for '{title[:40]}...'")
         
-        response = client.chat.completions.create(
-            model=model,
+        response = await client.chat.completions.create(
+            model=MODEL,
             messages=[
-                {
-                    "role": "system",
-                    "content": "You are a precise financial news classifier. Respond ONLY with a compact JSON object on a single line, no other text."
-                },
+                SYSTEM_MSG_CLASSIFY,
                 {
                     "role": "user", 
                     "content": CLASSIFICATION_PROMPT.format(title=title, summary=summary[:500])
                 }
             ],
+            response_format={"type": "json_object"},
             temperature=0.0,
+            seed=0,
             max_tokens=300
         )
         
@@ -240,47 +560,15 @@ def classify_with_llm(title: str, summary: str, client: "OpenAI", verbose: bool
         if debug:
             print(f"      DEBUG raw response: {repr(content[:200])}")
         
-        # Clean up the response - remove markdown code blocks
-        if "```" in content:
-            parts = content.split("```")
-            for part in parts:
-                part = part.strip()
-                if part.startswith("json"):
-                    part = part[4:].strip()
-                if part.startswith("{"):
-                    content = part
-                    break
-        
-        # Find the JSON object in the response
-        start_idx = content.find("{")
-        end_idx = content.rfind("}") + 1
-        if start_idx != -1 and end_idx > start_idx:
-            content = content[start_idx:end_idx]
-        
-        if debug:
-            print(f"      DEBUG cleaned JSON: {repr(content[:200])}")
-        
-        data = json.loads(content)
+        data = parse_json(content)
         
         if debug:
             print(f"      DEBUG parsed data keys: {list(data.keys())}")
         
-        # Handle both snake_case and possible variations
-        is_fund = data.get("is_fundraising", data.get("is_fundraising_event", data.get("fundraising", False)))
-        conf = data.get("confidence", 0.5)
-        
-        result = FundingClassification(
-            is_fundraising=bool(is_fund),
-            confidence=float(conf) if conf else 0.5,
-            company_name=data.get("company_name"),
-            amount=data.get("amount"),
-            round_type=data.get("round_type"),
-            reasoning=data.get("reasoning")
-        )
+        result = parse_classification(data)
         
         if verbose:
-            status = "✓" if result.is_fundraising else "✗"
-            print(f"      {status} [{result.confidence:.0%}] {title[:50]}...")
+            print_classification(title, result)
         
         return result
         
@@ -298,20 +586,143 @@ def classify_with_llm(title: str, summary: str, client: "OpenAI", verbose: bool
         return classify_with_keywords(title, summary)
 
 
+def classification_batch_request(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the chat completion body that classifies a batch of articles."""
+    articles = "\n\n".join(
+        f"[{i}] HEADLINE: {item['title']}\n    SUMMARY: {item['summary'][:500]}"
+        for i, item in enumerate(items)
+    )
+    return {
+        "model": MODEL,
+        "messages": [
+            SYSTEM_MSG_CLASSIFY_BATCH,
+            {
+                "role": "user",
+                "content": BATCH_CLASSIFICATION_PROMPT.format(articles=articles)
+            }
+        ],
+        "response_format": {"type": "json_object"},
+        "temperature": 0.0,
+        "seed": 0,
+        "max_tokens": 120 * len(items) + 100
+    }
+
+
+def parse_batch_classifications(content: str, count: int) -> Dict[int, FundingClassification]:
+    """Map a batch classification response to results by article index."""
+    by_index: Dict[int, FundingClassification] = {}
+    for entry in parse_json(content).get("results", []):
+        try:
+            index = int(entry.get("index"))
+        except (TypeError, ValueError):
+            continue
+        if 0 <= index < count:
+            by_index[index] = parse_classification(entry)
+    return by_index
+
+
+def print_classification(title: str, result: FundingClassification):
+    """Print a one-line classification verdict."""
+    status = "✓" if result.is_fundraising else "✗"
+    print(f"      {status} [{result.confidence:.0%}] {title[:50]}...")
+
+
+async def classify_batch_with_llm(items: List[Dict[str, Any]], client: "AsyncOpenAI", verbose: bool = False, debug: bool = False) -> List[FundingClassification]:
+    """Classify a batch of articles with a single LLM request.
+    
+    Results are matched back to articles by index. If the response can't be
+    parsed, or an article is missing from it, those articles fall back to
+    classify_with_llm one at a time.
+    """
+    by_index: Dict[int, FundingClassification] = {}
+    try:
+        if debug:
+            print(f"\n      DEBUG: Calling API for batch of {len(items)} articles")
+        
+        response = await client.chat.completions.create(**classification_batch_request(items))
+        
+        content = response.choices[0].message.content or "{}"
+        
+        if debug:
+            print(f"      DEBUG raw batch response: {repr(content[:200])}")
+        
+        by_index = parse_batch_classifications(content, len(items))
+    
+    except Exception as e:
+        if verbose or debug:
+            print(f"      ⚠ Batch LLM error, classifying {len(items)} articles individually: {type(e).__name__}: {e}")
+    
+    results = []
+    for i, item in enumerate(items):
+        result = by_index.get(i)
+        if result is None:
+            results.append(await classify_with_llm(item['title'], item['summary'], client, verbose=verbose, debug=debug))
+            continue
+        if verbose:
+            print_classification(item['title'], result)
+        results.append(result)
+    
+    return results
+
+
+async def classify_candidates_with_llm(candidates: List[Dict[str, Any]], client: "AsyncOpenAI",
+                                       cache: Optional[LLMResultCache] = None,
+                                       debug: bool = False,
+                                       use_batch_api: bool = False) -> List[FundingClassification]:
+    """Classify candidates in order, using the cache and concurrent LLM batches.
+    
+    With use_batch_api, uncached batches go through one OpenAI Batch API job
+    instead of live requests.
+    """
+    classifications = [
+        cache.get_classification(item['title'], item['link']) if cache else None
+        for item in candidates
+    ]
+    uncached = [item for item, cached in zip(candidates, classifications) if cached is None]
+    if cache:
+        print(f"   {len(candidates) - len(uncached)} classifications loaded from cache\n")
+    
+    batches = [
+        uncached[start:start + CLASSIFICATION_BATCH_SIZE]
+        for start in range(0, len(uncached), CLASSIFICATION_BATCH_SIZE)
+    ]
+    if use_batch_api:
+        fresh = await classify_with_batch_api(batches, client)
+    else:
+        batch_results = await gather_bounded(
+            [classify_batch_with_llm(batch, client, verbose=True, debug=debug) for batch in batches]
+        )
+        fresh = [classification for batch in batch_results for classification in batch]
+    
+    # Slot fresh results back in candidate order, caching real LLM answers
+    fresh_iter = iter(zip(uncached, fresh))
+    for i, cached in enumerate(classifications):
+        if cached is None:
+            item, classification = next(fresh_iter)
+            classifications[i] = classification
+            if cache and classification.method == "llm":
+                cache.set_classification(item['title'], item['link'], classification)
+    
+    return classifications
+
+
 def classify_with_keywords(title: str, summary: str) -> FundingClassification:
     """Fallback keyword-based classification."""
-    text = f"{title} {summary}".lower()
+    # Both scanners are case-insensitive, so no lowercased copy is needed
+    text = f"{title} {summary}"
     
     # Check for negative keywords first
-    if any(neg in text for neg in NEGATIVE_KEYWORDS):
+    if NEGATIVE_RE.search(text):
         return FundingClassification(
             is_fundraising=False,
             confidence=0.6,
-            reasoning="Contains editorial/opinion indicators"
+            reasoning="Contains editorial/opinion indicators",
+            method="keywords"
         )
     
     # Check for funding keywords
-    funding_matches = sum(1 for kw in FUNDING_KEYWORDS if kw in text)
+    # Distinct keywords, so "Raises ... raises" counts once
+    funding_matches = len({m.casefold() for m in FUNDING_RE.findall(text)})
     
     if funding_matches >= 2:
         # Extract amount if present
@@ -320,48 +731,133 @@ def classify_with_keywords(title: str, summary: str) -> FundingClassification:
             is_fundraising=True,
             confidence=min(0.5 + (funding_matches * 0.1), 0.9),
             amount=amount,
-            reasoning=f"Matched {funding_matches} funding keywords"
+            reasoning=f"Matched {funding_matches} funding keywords",
+            method="keywords"
         )
     elif funding_matches == 1:
         return FundingClassification(
             is_fundraising=True,
             confidence=0.4,
-            reasoning="Matched 1 funding keyword - low confidence"
+            reasoning="Matched 1 funding keyword - low confidence",
+            method="keywords"
         )
     
     return FundingClassification(
         is_fundraising=False,
         confidence=0.7,
-        reasoning="No funding keywords found"
+        reasoning="No funding keywords found",
+        method="keywords"
     )
 
 
-def is_funding_related(title: str, summary: str) -> bool:
-    """Check if article is about funding (keyword-based fallback)."""
-    text = f"{title} {summary}".lower()
-    return any(keyword in text for keyword in FUNDING_KEYWORDS)
+def extract_amount(text: str) -> str | None:
+    """Extract funding amount from text.
+    
+    Dollar amounts in millions win over dollar amounts in billions (more
+    often a valuation than a raise); a bare "N million" is the last resort.
+    """
+    best = None
+    best_rank = 3
+    for match in AMOUNT_RE.finditer(text):
+        unit = match.group('unit').lower()
+        if match.group('dollar'):
+            rank = 0 if unit[0] == 'm' else 1
+        elif unit == 'million':
+            rank = 2
+        else:
+            continue
+        if rank < best_rank:
+            best, best_rank = match, rank
+            if rank == 0:
+                break
+    
+    if best is None:
+        return None
+    suffix = 'B' if best.group('unit')[0].lower() == 'b' else 'M'
+    return f"${best.group('num')}{suffix}"
+
+
+def clean_html(text: str, max_chars: Optional[int] = None) -> str:
+    """Remove HTML tags from text, optionally truncating the result.
+
+    With max_chars set, only a bounded prefix of the raw HTML is scanned
+    instead of stripping a full article body just to throw most of it away.
+    """
+    if max_chars is None:
+        return HTML_TAG_RE.sub('', text).strip()
+    
+    raw = text[:max_chars * 8]
+    if len(raw) < len(text):
+        # Don't leave half a tag behind at the cut
+        open_idx = raw.rfind('<')
+        if open_idx > raw.rfind('>'):
+            raw = raw[:open_idx]
+    return HTML_TAG_RE.sub('', raw).strip()[:max_chars]
 
 
-def extract_amount(text: str) -> str | None:
-    """Extract funding amount from text."""
-    patterns = [
-        r'\$(\d+(?:\.\d+)?)\s*(?:million|m\b)',
-        r'\$(\d+(?:\.\d+)?)\s*(?:billion|b\b)',
-        r'(\d+(?:\.\d+)?)\s*million',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text.lower())
-        if match:
-            amount = match.group(1)
-            if 'billion' in text.lower():
-                return f"${amount}B"
-            return f"${amount}M"
-    return None
+def parse_published_date(value: str) -> Optional[datetime]:
+    """Parse a feed date string into a naive UTC datetime.
+    
+    RSS pubDate is RFC 822 and Atom dates are ISO 8601, both of which the
+    stdlib parses much faster than dateutil's generic parser, so dateutil
+    is only tried as a fallback.
+    """
+    try:
+        published_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            published_at = datetime.fromisoformat(value)
+        except ValueError:
+            try:
+                published_at = date_parser.parse(value)
+            except (ValueError, OverflowError):
+                return None
+    
+    if published_at.tzinfo is not None:
+        # Match published_parsed, which feedparser normalizes to UTC
+        published_at = published_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return published_at
+
 
+@functools.cache
+def article_strainer() -> "SoupStrainer":
+    """Tags that can hold article text; everything else is skipped at parse time."""
+    from bs4 import SoupStrainer
+    return SoupStrainer(['article', 'main', 'div', 'section'])
 
-def clean_html(text: str) -> str:
-    """Remove HTML tags from text."""
-    return re.sub(r'<[^>]+>', '', text).strip()
+
+def extract_article_text(html: str) -> Optional[str]:
+    """Extract the main article text from an HTML page."""
+    from bs4 import BeautifulSoup
+    
+    # Only build the tree for content containers; <head> and its scripts
+    # and styles are never materialized
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=article_strainer())
+    
+    # Remove script and style elements nested inside the containers
+    for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe']):
+        element.decompose()
+    
+    # Try to find article content using common selectors, most specific first
+    content = None
+    for selector in ARTICLE_SELECTORS:
+        element = soup.select_one(selector)
+        if element:
+            content = element.get_text(separator='\n', strip=True)
+            break
+    
+    # Fallback to every container if no article container found
+    if not content:
+        content = soup.get_text(separator='\n', strip=True)
+    
+    if content:
+        # Clean up whitespace
+        lines = [line.strip() for line in content.split('\n') if line.strip()]
+        content = '\n'.join(lines)
+        # Truncate to reasonable length for LLM
+        return content[:8000]
+    
+    return None
 
 
 def fetch_article_content(url: str, timeout: int = 10) -> Optional[str]:
@@ -370,123 +866,113 @@ def fetch_article_content(url: str, timeout: int = 10) -> Optional[str]:
         return None
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=timeout)
+        response = article_session().get(url, timeout=timeout)
         response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Remove script and style elements
-        for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe']):
-            element.decompose()
-        
-        # Try to find article content using common selectors
-        content = None
-        selectors = [
-            'article',
-            '[role="main"]',
-            '.article-content',
-            '.post-content',
-            '.entry-content',
-            '.story-body',
-            '.article-body',
-            'main',
-            '.content'
-        ]
-        
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                content = element.get_text(separator='\n', strip=True)
-                break
-        
-        # Fallback to body if no article container found
-        if not content:
-            body = soup.find('body')
-            if body:
-                content = body.get_text(separator='\n', strip=True)
-        
-        if content:
-            # Clean up whitespace
-            lines = [line.strip() for line in content.split('\n') if line.strip()]
-            content = '\n'.join(lines)
-            # Truncate to reasonable length for LLM
-            return content[:8000]
-        
-        return None
-        
+        return extract_article_text(response.text)
     except Exception as e:
         return None
 
 
-def run_mena_analysis(title: str, content: str, client: "OpenAI", verbose: bool = True) -> Optional[MENAAnalysis]:
+def create_article_client(timeout: int = 10) -> Optional["httpx.AsyncClient"]:
+    """Create a pooled async client for article fetches, or None without httpx.
+    
+    The transport retries failed connections; status retries are handled
+    in fetch_article_content_async.
+    """
+    if not (SCRAPING_AVAILABLE and HTTPX_AVAILABLE):
+        return None
+    import httpx
+    
+    # A custom transport replaces the client's own, so pooling and HTTP/2
+    # are configured here
+    transport = httpx.AsyncHTTPTransport(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=ARTICLE_FETCH_CONCURRENCY),
+        retries=HTTP_RETRIES
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        headers={'User-Agent': USER_AGENT},
+        timeout=timeout,
+        follow_redirects=True
+    )
+
+
+async def fetch_article_content_async(url: str, http_client: Optional["httpx.AsyncClient"] = None) -> Optional[str]:
+    """Fetch and extract an article without blocking the event loop.
+    
+    Rate-limit and server errors are retried like create_http_session does.
+    """
+    if not SCRAPING_AVAILABLE:
+        return None
+    if http_client is None:
+        return await asyncio.to_thread(fetch_article_content, url)
+    
+    try:
+        for attempt in range(HTTP_RETRIES + 1):
+            response = await http_client.get(url)
+            if response.status_code not in HTTP_RETRY_STATUSES or attempt == HTTP_RETRIES:
+                break
+            await asyncio.sleep(HTTP_RETRY_BACKOFF * 2 ** attempt)
+        response.raise_for_status()
+        return extract_article_text(response.text)
+    except Exception:
+        return None
+
+
+def mena_analysis_request(title: str, content: str) -> Dict[str, Any]:
+    """Build the chat completion body for an article's MENA analysis."""
+    return {
+        "model": MODEL,
+        "messages": [
+            SYSTEM_MSG_MENA,
+            {
+                "role": "user",
+                "content": MENA_ANALYSIS_PROMPT.format(title=title, content=content[:6000])
+            }
+        ],
+        "response_format": {"type": "json_object"},
+        "temperature": 0.3,
+        "seed": 0,
+        "max_tokens": 1500
+    }
+
+
+def parse_mena_analysis(data: Dict[str, Any]) -> MENAAnalysis:
+    """Build a MENAAnalysis from parsed LLM JSON, defaulting missing fields."""
+    return MENAAnalysis(
+        innovation_summary=data.get("innovation_summary", ""),
+        innovation_type=data.get("innovation_type", "Unknown"),
+        problem_solution_fit=data.get("problem_solution_fit", ""),
+        target_sectors=data.get("target_sectors", []),
+        vision_2030_alignment=data.get("vision_2030_alignment", ""),
+        arabic_complexity=data.get("arabic_complexity", "Unknown"),
+        arabic_complexity_notes=data.get("arabic_complexity_notes", ""),
+        regulatory_fit=data.get("regulatory_fit", "Unknown"),
+        regulatory_fit_notes=data.get("regulatory_fit_notes", ""),
+        market_readiness=data.get("market_readiness", "Unknown"),
+        market_readiness_notes=data.get("market_readiness_notes", ""),
+        infrastructure_fit=data.get("infrastructure_fit", "Unknown"),
+        infrastructure_fit_notes=data.get("infrastructure_fit_notes", ""),
+        potential_buyers=data.get("potential_buyers", []),
+        sales_motion=data.get("sales_motion", ""),
+        commercialization_potential=data.get("commercialization_potential", "Unknown"),
+        localization_requirement=data.get("localization_requirement", "Unknown"),
+        priority=data.get("priority", "Unknown"),
+        justification=data.get("justification", "")
+    )
+
+
+async def run_mena_analysis(title: str, content: str, client: "AsyncOpenAI", verbose: bool = True) -> Optional[MENAAnalysis]:
     """Run MENA market analysis on an article using LLM."""
     try:
-        model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-        
         # Use summary if content is too short
         if not content or len(content) < 100:
             return None
         
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a venture analyst specializing in MENA markets. Respond only with valid JSON."
-                },
-                {
-                    "role": "user",
-                    "content": MENA_ANALYSIS_PROMPT.format(title=title, content=content[:6000])
-                }
-            ],
-            temperature=0.3,
-            max_tokens=1500
-        )
+        response = await client.chat.completions.create(**mena_analysis_request(title, content))
         
-        response_content = response.choices[0].message.content.strip()
-        
-        # Clean up JSON
-        if "```" in response_content:
-            parts = response_content.split("```")
-            for part in parts:
-                part = part.strip()
-                if part.startswith("json"):
-                    part = part[4:].strip()
-                if part.startswith("{"):
-                    response_content = part
-                    break
-        
-        start_idx = response_content.find("{")
-        end_idx = response_content.rfind("}") + 1
-        if start_idx != -1 and end_idx > start_idx:
-            response_content = response_content[start_idx:end_idx]
-        
-        data = json.loads(response_content)
-        
-        return MENAAnalysis(
-            innovation_summary=data.get("innovation_summary", ""),
-            innovation_type=data.get("innovation_type", "Unknown"),
-            problem_solution_fit=data.get("problem_solution_fit", ""),
-            target_sectors=data.get("target_sectors", []),
-            vision_2030_alignment=data.get("vision_2030_alignment", ""),
-            arabic_complexity=data.get("arabic_complexity", "Unknown"),
-            arabic_complexity_notes=data.get("arabic_complexity_notes", ""),
-            regulatory_fit=data.get("regulatory_fit", "Unknown"),
-            regulatory_fit_notes=data.get("regulatory_fit_notes", ""),
-            market_readiness=data.get("market_readiness", "Unknown"),
-            market_readiness_notes=data.get("market_readiness_notes", ""),
-            infrastructure_fit=data.get("infrastructure_fit", "Unknown"),
-            infrastructure_fit_notes=data.get("infrastructure_fit_notes", ""),
-            potential_buyers=data.get("potential_buyers", []),
-            sales_motion=data.get("sales_motion", ""),
-            commercialization_potential=data.get("commercialization_potential", "Unknown"),
-            localization_requirement=data.get("localization_requirement", "Unknown"),
-            priority=data.get("priority", "Unknown"),
-            justification=data.get("justification", "")
-        )
+        return parse_mena_analysis(parse_json(response.choices[0].message.content))
         
     except Exception as e:
         if verbose:
@@ -494,61 +980,600 @@ def run_mena_analysis(title: str, content: str, client: "OpenAI", verbose: bool
         return None
 
 
-def print_mena_analysis(item: Dict[str, Any], analysis: MENAAnalysis, index: int):
-    """Pretty print the MENA analysis for an article."""
-    print(f"\n{'='*80}")
-    print(f"📊 MENA ANALYSIS #{index}: {item['title'][:60]}...")
-    print(f"{'='*80}")
+def choose_mena_content(item: Dict[str, Any], full_content: Optional[str]) -> Tuple[str, str]:
+    """Pick the fetched article text, or the RSS summary as fallback, with a label."""
+    if full_content:
+        return "full article", full_content
+    return "RSS summary", item['summary']
+
+
+async def analyze_article_for_mena(item: Dict[str, Any], client: "AsyncOpenAI",
+                                   http_client: Optional["httpx.AsyncClient"] = None,
+                                   cache: Optional[LLMResultCache] = None) -> Tuple[str, int, Optional[MENAAnalysis]]:
+    """Fetch an article and run MENA analysis on it, or on its RSS summary.
     
-    # Company & Funding Info
-    print(f"\n🏢 Company: {item.get('company', 'Unknown')}")
-    print(f"💰 Funding: {item.get('amount', 'Unknown')} ({item.get('round_type', 'Unknown')})")
-    print(f"🔗 {item['link']}")
+    Returns a label for the content used, its length, and the analysis.
+    """
+    full_content = await fetch_article_content_async(item['link'], http_client)
+    content_source, content = choose_mena_content(item, full_content)
     
-    # 1. Innovation Summary
-    print(f"\n📌 INNOVATION SUMMARY")
-    print(f"   Type: {analysis.innovation_type}")
-    print(f"   {analysis.innovation_summary}")
+    analysis = cache.get_mena(item['link'], content) if cache else None
+    if analysis is None:
+        analysis = await run_mena_analysis(item['title'], content, client)
+        if analysis and cache:
+            cache.set_mena(item['link'], content, analysis)
+    return content_source, len(content), analysis
+
+
+async def analyze_articles_for_mena(items: List[Dict[str, Any]], client: "AsyncOpenAI",
+                                    cache: Optional[LLMResultCache] = None) -> List[Tuple[str, int, Optional[MENAAnalysis]]]:
+    """Fetch and analyze articles concurrently, so scraping overlaps LLM calls."""
+    http_client = create_article_client()
+    try:
+        return await gather_bounded(
+            [analyze_article_for_mena(item, client, http_client, cache) for item in items]
+        )
+    finally:
+        if http_client is not None:
+            await http_client.aclose()
+
+
+async def submit_batch(requests_by_id: Dict[str, Dict[str, Any]], client: "AsyncOpenAI") -> str:
+    """Upload chat completion bodies as a JSONL file and start a Batch API job.
     
-    # 2. Problem-Solution Fit
-    print(f"\n🎯 PROBLEM-SOLUTION FIT IN MENA")
-    print(f"   {analysis.problem_solution_fit}")
-    print(f"   Target Sectors: {', '.join(analysis.target_sectors)}")
-    print(f"   Vision 2030: {analysis.vision_2030_alignment}")
+    Returns the batch id. Keys of requests_by_id come back as custom_id.
+    """
+    lines = "\n".join(
+        json.dumps({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body})
+        for custom_id, body in requests_by_id.items()
+    )
+    batch_file = await client.files.create(file=("requests.jsonl", lines.encode("utf-8")), purpose="batch")
+    batch = await client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    print(f"   📦 Submitted batch {batch.id} with {len(requests_by_id)} requests, waiting for results...")
+    return batch.id
+
+
+async def call_batch_api(call, *args) -> Any:
+    """Await a Batch API call, retrying connection, rate-limit and server errors.
     
-    # 3. Localizability Scorecard
-    print(f"\n📋 LOCALIZABILITY SCORECARD")
-    print(f"   ┌─────────────────────┬────────┬─────────────────────────────────────┐")
-    print(f"   │ Factor              │ Rating │ Notes                               │")
-    print(f"   ├─────────────────────┼────────┼─────────────────────────────────────┤")
-    print(f"   │ Arabic Complexity   │ {analysis.arabic_complexity:6} │ {analysis.arabic_complexity_notes[:35]:35} │")
-    print(f"   │ Regulatory Fit      │ {analysis.regulatory_fit:6} │ {analysis.regulatory_fit_notes[:35]:35} │")
-    print(f"   │ Market Readiness    │ {analysis.market_readiness:6} │ {analysis.market_readiness_notes[:35]:35} │")
-    print(f"   │ Infrastructure Fit  │ {analysis.infrastructure_fit:6} │ {analysis.infrastructure_fit_notes[:35]:35} │")
-    print(f"   └─────────────────────┴────────┴─────────────────────────────────────┘")
+    A job can run for hours, so one dropped connection should not throw away
+    the whole batch. Other errors, and the last failed attempt, are raised.
+    """
+    import openai
+    transient = (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError)
+    for attempt in range(1, BATCH_API_ATTEMPTS + 1):
+        try:
+            return await call(*args)
+        except transient as e:
+            if attempt == BATCH_API_ATTEMPTS:
+                raise
+            print(f"   ⚠️  Batch API call failed ({e}), retrying in {BATCH_POLL_INTERVAL}s...")
+            await asyncio.sleep(BATCH_POLL_INTERVAL)
+
+
+async def poll_batch(batch_id: str, client: "AsyncOpenAI") -> Dict[str, str]:
+    """Wait for a Batch API job to finish and return response content by custom_id.
     
-    # 4. Commercial Buyer Map
-    print(f"\n🛒 COMMERCIAL BUYER MAP")
-    print(f"   Potential Buyers: {', '.join(analysis.potential_buyers)}")
-    print(f"   Sales Motion: {analysis.sales_motion}")
+    Requests that failed, or never ran because the batch expired or was
+    cancelled, are missing from the result; failures are counted and the
+    first error message is printed.
+    """
+    while True:
+        batch = await call_batch_api(client.batches.retrieve, batch_id)
+        if batch.status in ("completed", "failed", "expired", "cancelled"):
+            break
+        await asyncio.sleep(BATCH_POLL_INTERVAL)
     
-    # 5. Opportunity Rating
-    print(f"\n⭐ OPPORTUNITY RATING")
+    if batch.status != "completed":
+        print(f"   ⚠️  Batch {batch_id} {batch.status}; using whatever results it produced")
+    
+    contents = {}
+    errors = []
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if not file_id:
+            continue
+        output = await call_batch_api(client.files.content, file_id)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = parse_json(line)
+            response = record.get("response") or {}
+            if response.get("status_code") == 200:
+                contents[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"] or "{}"
+            else:
+                error = record.get("error") or (response.get("body") or {}).get("error") or {}
+                errors.append(error.get("message") or f"status {response.get('status_code')}")
+    
+    if errors:
+        print(f"   ⚠️  {len(errors)} batch requests failed, e.g. {errors[0]}")
+    return contents
+
+
+async def classify_with_batch_api(batches: List[List[Dict[str, Any]]], client: "AsyncOpenAI") -> List[FundingClassification]:
+    """Classify article batches through one Batch API job, in input order.
+    
+    Articles without a usable result fall back to keyword classification,
+    since a per-article retry would defeat the point of batch pricing.
+    """
+    requests_by_id = {f"classify-{n}": classification_batch_request(batch) for n, batch in enumerate(batches)}
+    contents = await poll_batch(await submit_batch(requests_by_id, client), client) if requests_by_id else {}
+    
+    results = []
+    for n, batch in enumerate(batches):
+        try:
+            by_index = parse_batch_classifications(contents.get(f"classify-{n}", "{}"), len(batch))
+        except Exception:
+            by_index = {}
+        for i, item in enumerate(batch):
+            result = by_index.get(i) or classify_with_keywords(item['title'], item['summary'])
+            print_classification(item['title'], result)
+            results.append(result)
+    return results
+
+
+async def analyze_articles_with_batch_api(items: List[Dict[str, Any]], client: "AsyncOpenAI",
+                                          cache: Optional[LLMResultCache] = None) -> List[Tuple[str, int, Optional[MENAAnalysis]]]:
+    """Fetch articles, then run their MENA analyses through one Batch API job."""
+    http_client = create_article_client()
+    try:
+        full_contents = await gather_bounded(
+            [fetch_article_content_async(item['link'], http_client) for item in items],
+            ARTICLE_FETCH_CONCURRENCY
+        )
+    finally:
+        if http_client is not None:
+            await http_client.aclose()
+    
+    chosen = [choose_mena_content(item, full_content) for item, full_content in zip(items, full_contents)]
+    analyses = [
+        cache.get_mena(item['link'], content) if cache else None
+        for item, (_, content) in zip(items, chosen)
+    ]
+    
+    # Same length cutoff as run_mena_analysis
+    requests_by_id = {
+        f"mena-{i}": mena_analysis_request(item['title'], content)
+        for i, (item, (_, content), analysis) in enumerate(zip(items, chosen, analyses))
+        if analysis is None and len(content) >= 100
+    }
+    contents = await poll_batch(await submit_batch(requests_by_id, client), client) if requests_by_id else {}
+    
+    for i, (item, (_, content)) in enumerate(zip(items, chosen)):
+        if f"mena-{i}" not in contents:
+            continue
+        try:
+            analyses[i] = parse_mena_analysis(parse_json(contents[f"mena-{i}"]))
+        except Exception as e:
+            print(f"      ⚠ MENA analysis error: {e}")
+            continue
+        if cache:
+            cache.set_mena(item['link'], content, analyses[i])
+    
+    return [
+        (content_source, len(content), analysis)
+        for (content_source, content), analysis in zip(chosen, analyses)
+    ]
+
+
+def format_mena_analysis(item: Dict[str, Any], analysis: MENAAnalysis, index: int) -> str:
+    """Render the MENA analysis for an article as printable text."""
+    # Rating markers
     comm_emoji = "🟢" if analysis.commercialization_potential == "High" else "🟡" if analysis.commercialization_potential == "Medium" else "🔴"
     loc_emoji = "🟢" if analysis.localization_requirement == "Minor" else "🟡" if analysis.localization_requirement == "Moderate" else "🔴"
     pri_emoji = "🚀" if "prototyping" in analysis.priority.lower() else "👀" if "tracking" in analysis.priority.lower() else "⏸️"
     
-    print(f"   {comm_emoji} Commercialization Potential: {analysis.commercialization_potential}")
-    print(f"   {loc_emoji} Localization Requirement: {analysis.localization_requirement}")
-    print(f"   {pri_emoji} Priority: {analysis.priority}")
+    # Adjacent f-strings compile to a single string build
+    return (
+        f"\n{SEP_EQ}\n"
+        f"📊 MENA ANALYSIS #{index}: {item['title'][:60]}...\n"
+        f"{SEP_EQ}\n"
+        # Company & Funding Info
+        f"\n🏢 Company: {item.get('company', 'Unknown')}\n"
+        f"💰 Funding: {item.get('amount', 'Unknown')} ({item.get('round_type', 'Unknown')})\n"
+        f"🔗 {item['link']}\n"
+        # 1. Innovation Summary
+        f"\n📌 INNOVATION SUMMARY\n"
+        f"   Type: {analysis.innovation_type}\n"
+        f"   {analysis.innovation_summary}\n"
+        # 2. Problem-Solution Fit
+        f"\n🎯 PROBLEM-SOLUTION FIT IN MENA\n"
+        f"   {analysis.problem_solution_fit}\n"
+        f"   Target Sectors: {analysis.target_sectors_str}\n"
+        f"   Vision 2030: {analysis.vision_2030_alignment}\n"
+        # 3. Localizability Scorecard
+        f"\n📋 LOCALIZABILITY SCORECARD\n"
+        f"   ┌─────────────────────┬────────┬─────────────────────────────────────┐\n"
+        f"   │ Factor              │ Rating │ Notes                               │\n"
+        f"   ├─────────────────────┼────────┼─────────────────────────────────────┤\n"
+        f"   │ Arabic Complexity   │ {analysis.arabic_complexity:6} │ {analysis.arabic_complexity_notes[:35]:35} │\n"
+        f"   │ Regulatory Fit      │ {analysis.regulatory_fit:6} │ {analysis.regulatory_fit_notes[:35]:35} │\n"
+        f"   │ Market Readiness    │ {analysis.market_readiness:6} │ {analysis.market_readiness_notes[:35]:35} │\n"
+        f"   │ Infrastructure Fit  │ {analysis.infrastructure_fit:6} │ {analysis.infrastructure_fit_notes[:35]:35} │\n"
+        f"   └─────────────────────┴────────┴─────────────────────────────────────┘\n"
+        # 4. Commercial Buyer Map
+        f"\n🛒 COMMERCIAL BUYER MAP\n"
+        f"   Potential Buyers: {analysis.potential_buyers_str}\n"
+        f"   Sales Motion: {analysis.sales_motion}\n"
+        # 5. Opportunity Rating
+        f"\n⭐ OPPORTUNITY RATING\n"
+        f"   {comm_emoji} Commercialization Potential: {analysis.commercialization_potential}\n"
+        f"   {loc_emoji} Localization Requirement: {analysis.localization_requirement}\n"
+        f"   {pri_emoji} Priority: {analysis.priority}\n"
+        # 6. Justification
+        f"\n💡 JUSTIFICATION\n"
+        f"   {analysis.justification}\n"
+    )
+
+
+def create_http_session() -> "requests.Session":
+    """Create a requests session with the shared headers; reuses connections per host.
+    
+    Transient failures (connection errors, 429 and 5xx) are retried
+    HTTP_RETRIES times with a short backoff before the last response is returned.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     
-    # 6. Justification
-    print(f"\n💡 JUSTIFICATION")
-    print(f"   {analysis.justification}")
+    retry = Retry(
+        total=HTTP_RETRIES,
+        backoff_factor=HTTP_RETRY_BACKOFF,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=ARTICLE_FETCH_CONCURRENCY,
+        pool_maxsize=ARTICLE_FETCH_CONCURRENCY,
+        max_retries=retry
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'User-Agent': USER_AGENT})
+    return session
+
+
+@functools.cache
+def article_session() -> "requests.Session":
+    """Session shared by every article fetch, so same-host articles reuse connections."""
+    return create_http_session()
+
+
+def xml_local_name(tag: str) -> str:
+    """Strip the '{namespace}' prefix ElementTree puts on tag names."""
+    return tag.rsplit('}', 1)[-1]
+
+
+def is_primary_feed_tag(tag: str) -> bool:
+    """True for plain RSS tags and Atom tags, False for extension namespaces like media: or dc:."""
+    return not tag.startswith('{') or tag.startswith(ATOM_NAMESPACE)
+
+
+def parse_feed_xml(xml_bytes: bytes) -> List[Dict[str, Any]]:
+    """Read title, link, summary and published date from RSS or Atom XML.
+    
+    Only the four fields the pipeline uses are extracted, which skips
+    feedparser's sanitizing and normalization of every element. Raises
+    ElementTree.ParseError on XML it can't handle.
+    """
+    root = ElementTree.fromstring(xml_bytes)
+    entries = []
+    
+    for node in root.iter():
+        if xml_local_name(node.tag) not in ('item', 'entry'):
+            continue
+        
+        # Extension elements (media:title, media:content, dc:date, ...) only
+        # fill fields the entry's own RSS or Atom elements leave empty
+        fields: Dict[str, str] = {}
+        extension_fields: Dict[str, str] = {}
+        link = ''
+        for child in node:
+            name = xml_local_name(child.tag)
+            primary = is_primary_feed_tag(child.tag)
+            if name == 'link':
+                if not primary:
+                    continue
+                # RSS puts the URL in the text, Atom in an href attribute
+                href = child.get('href')
+                if href is None and not link:
+                    link = (child.text or '').strip()
+                elif href and child.get('rel', 'alternate') == 'alternate':
+                    link = href
+            else:
+                target = fields if primary else extension_fields
+                if name not in target:
+                    target[name] = ''.join(child.itertext())
+        fields = {**extension_fields, **fields}
+        
+        published = next((fields[k].strip() for k in ('pubDate', 'published', 'date', 'updated') if fields.get(k)), None)
+        entries.append({
+            'title': fields.get('title', 'Untitled').strip(),
+            'link': link,
+            'summary': fields.get('description') or fields.get('summary') or fields.get('content', ''),
+            'published': parse_published_date(published) if published else None,
+        })
+    
+    return entries
+
+
+def feedparser_entries(feed) -> List[Dict[str, Any]]:
+    """Convert a feedparser result into the same dicts parse_feed_xml returns."""
+    entries = []
+    for entry in feed.entries:
+        # Parse published date
+        published_at = None
+        if hasattr(entry, 'published_parsed') and entry.published_parsed:
+            published_at = datetime(*entry.published_parsed[:6])
+        elif hasattr(entry, 'published'):
+            published_at = parse_published_date(entry.published)
+        
+        entries.append({
+            'title': entry.get('title', 'Untitled'),
+            'link': entry.get('link', ''),
+            'summary': entry.get('summary', entry.get('description', '')),
+            'published': published_at,
+        })
+    return entries
+
+
+def fetch_feed_entries(feed_url: str, session: Optional["requests.Session"] = None) -> List[Dict[str, Any]]:
+    """Download a feed and return its entries.
+    
+    With a session, the feed is fetched over a pooled connection and parsed
+    with ElementTree, falling back to feedparser for malformed XML. Without
+    one (requests not installed) feedparser does the whole job.
+    """
+    # feedparser is slow to import and only a fallback, so load it on demand
+    if session is None:
+        import feedparser
+        return feedparser_entries(feedparser.parse(feed_url))
+    
+    response = session.get(feed_url, timeout=FEED_TIMEOUT)
+    response.raise_for_status()
+    try:
+        return parse_feed_xml(response.content)
+    except ElementTree.ParseError:
+        import feedparser
+        return feedparser_entries(feedparser.parse(response.content))
+
+
+def fetch_feed_candidates(feed_name: str, feed_url: str, window_start: datetime, window_end: datetime,
+                          session: Optional["requests.Session"] = None) -> List[Dict[str, Any]]:
+    """Fetch one RSS feed and return funding-related entries published in the window."""
+    candidates = []
+    try:
+        for entry in fetch_feed_entries(feed_url, session):
+            published_at = entry['published']
+            if not published_at:
+                continue
+            
+            # Check if inside the date window
+            if not (window_start <= published_at < window_end):
+                continue
+            
+            title = entry['title']
+            link = entry['link']
+            
+            # Pre-filter: quick keyword check to reduce LLM calls. The raw
+            # summary is screened first so entries with no keyword anywhere
+            # are dropped without stripping their HTML
+            title_match = FUNDING_RE.search(title)
+            if not title_match and not FUNDING_RE.search(entry['summary']):
+                continue
+            
+            summary = clean_html(entry['summary'], max_chars=500)
+            if not title_match and not FUNDING_RE.search(summary):
+                continue
+            
+            candidates.append({
+                'source': feed_name,
+                'title': title,
+                'link': link,
+                'summary': summary,
+                'published': published_at,
+            })
+            
+    except Exception as e:
+        print(f"   Error fetching {feed_name}: {e}")
+    
+    return candidates
+
+
+def title_words(title: str) -> frozenset:
+    """Return the words of a lowercased title that tell one story from another.
+    
+    Stop words, funding keywords (including plurals like "investors") and
+    anything with a digit, such as "5m" or "2024", are left out.
+    """
+    return frozenset(
+        token for token in TITLE_TOKEN_RE.findall(title)
+        if token not in TITLE_STOP_WORDS
+        and not FUNDING_RE.match(token)
+        and not any(char.isdigit() for char in token)
+    )
+
+
+def deduplicate_candidates(candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop repeated stories, keeping the first copy seen.
+    
+    Two titles are the same story if they share their first 50 characters or
+    their distinctive words (see title_words) have a Jaccard similarity of at
+    least TITLE_SIMILARITY_THRESHOLD, which catches one outlet's headline
+    reworded by another. Titles with fewer than TITLE_MIN_TOKENS distinctive
+    words only get the prefix check.
+    
+    Templated headlines about different companies are kept:
+    "Exclusive: Foo raises $10 million seed round led by Sequoia" and the same
+    headline for Bar compare as {foo, sequoia} and {bar, sequoia}.
+    """
+    seen_prefixes = set()
+    seen_tokens: List[frozenset] = []
+    unique = []
+    
+    for item in candidates:
+        title = item['title'].lower()
+        prefix = title[:50]
+        if prefix in seen_prefixes:
+            continue
+        
+        tokens = title_words(title)
+        comparable = len(tokens) >= TITLE_MIN_TOKENS
+        if comparable and any(
+            len(tokens & other) >= TITLE_SIMILARITY_THRESHOLD * len(tokens | other)
+            for other in seen_tokens
+        ):
+            continue
+        
+        seen_prefixes.add(prefix)
+        if comparable:
+            seen_tokens.append(tokens)
+        unique.append(item)
+    
+    return unique
+
+
+async def classify_and_report(unique_candidates: List[Dict[str, Any]], openai_client: Optional["AsyncOpenAI"],
+                              cache: Optional[LLMResultCache], run_mena: bool,
+                              use_batch_api: bool = False) -> List[Dict[str, Any]]:
+    """Classify candidates, print the report and, if requested, the MENA analysis.
+    
+    LLM classification and MENA analysis run on one event loop, which owns
+    the async OpenAI client's connection pool; the client is closed here.
+    """
+    try:
+        # Second pass: classify with LLM or keywords
+        confirmed_news = []
+        rejected_count = 0
+        
+        # Check for debug mode (set in main block)
+        debug_mode = globals().get('DEBUG_MODE', False)
+        
+        if openai_client:
+            print("🔍 Classifying articles with LLM...\n")
+            classifications = await classify_candidates_with_llm(
+                unique_candidates, openai_client, cache, debug=debug_mode, use_batch_api=use_batch_api
+            )
+        
+            for item, classification in zip(unique_candidates, classifications):
+                if classification.is_fundraising and classification.confidence >= 0.6:
+                    item['classification'] = classification
+                    item['amount'] = classification.amount or extract_amount(f"{item['title']} {item['summary']}")
+                    item['company'] = classification.company_name
+                    item['round_type'] = classification.round_type
+                    item['confidence'] = classification.confidence
+                    confirmed_news.append(item)
+                else:
+                    rejected_count += 1
+        
+            print(f"\n   ✅ Accepted: {len(confirmed_news)} | ❌ Rejected: {rejected_count}\n")
+        else:
+            # Keyword-based fallback
+            print("🔍 Classifying articles with keywords...")
+            for item in unique_candidates:
+                classification = classify_with_keywords(item['title'], item['summary'])
+        
+                if classification.is_fundraising and classification.confidence >= 0.5:
+                    item['classification'] = classification
+                    # Already extracted from the same title + summary text
+                    item['amount'] = classification.amount
+                    item['company'] = classification.company_name
+                    item['round_type'] = classification.round_type
+                    item['confidence'] = classification.confidence
+                    confirmed_news.append(item)
+        
+            print(f"   Classification complete!\n")
+        
+        # Newest first, ties broken by confidence
+        confirmed_news.sort(key=lambda x: (x['published'], x.get('confidence', 0)), reverse=True)
+        
+        # Date strings for the exports, formatted once per result; exporters
+        # format 'published' themselves for results without them
+        for item in confirmed_news:
+            published = item['published']
+            item['published_date'] = f"{published.year}-{published.month:02}-{published.day:02}"
+            item['published_iso'] = published.isoformat()
+        
+        if not confirmed_news:
+            print("❌ No AI startup funding news found from yesterday.")
+            print("\n💡 Tips:")
+            print("   - Try running this script on a weekday for more results")
+            print("   - Set OPENAI_API_KEY for better classification accuracy")
+            return []
+        
+        print(f"✅ Found {len(confirmed_news)} confirmed funding news items:\n")
+        print("-" * 60)
+        
+        # Each item is rendered to lines and written in one call
+        for i, item in enumerate(confirmed_news, 1):
+            # Build info string
+            info_parts = []
+            if item.get('amount'):
+                info_parts.append(item['amount'])
+            if item.get('round_type'):
+                info_parts.append(item['round_type'])
+            if item.get('confidence'):
+                info_parts.append(f"{int(item['confidence'] * 100)}% conf")
+        
+            info_str = f" [{', '.join(info_parts)}]" if info_parts else ""
+        
+            lines = [f"{i}. {item['title']}{info_str}"]
+            if item.get('company'):
+                lines.append(f"   🏢 Company: {item['company']}")
+            lines.append(f"   📰 Source: {item['source']}")
+            lines.append(f"   🔗 {item['link']}")
+            if item['summary']:
+                lines.append(f"   📝 {item['summary'][:150]}...")
+            sys.stdout.write("\n".join(lines) + "\n\n")
+        
+        # Run MENA analysis if requested
+        if run_mena and confirmed_news and openai_client:
+            print("\n" + "=" * 60)
+            print("🌍 RUNNING MENA MARKET ANALYSIS")
+            print("=" * 60)
+        
+            if not SCRAPING_AVAILABLE:
+                print("\n⚠️  Web scraping not available. Install with: pip install requests beautifulsoup4")
+                print("   Using RSS summaries instead of full article content.\n")
+        
+            # Each article is fetched and analyzed in one task, so scraping
+            # overlaps LLM calls; gather() keeps rank order for the report
+            print(f"\n📄 Fetching and analyzing {len(confirmed_news)} articles...")
+            if use_batch_api:
+                mena_results = await analyze_articles_with_batch_api(confirmed_news, openai_client, cache)
+            else:
+                mena_results = await analyze_articles_for_mena(confirmed_news, openai_client, cache)
+        
+            for i, (item, (content_source, content_length, analysis)) in enumerate(zip(confirmed_news, mena_results), 1):
+                report = (
+                    f"\n📄 Article {i}/{len(confirmed_news)}: {item['title'][:50]}...\n"
+                    f"   Used {content_source} ({content_length} chars)\n"
+                )
+        
+                if analysis:
+                    item['mena_analysis'] = analysis
+                    report += format_mena_analysis(item, analysis, i)
+                else:
+                    report += "   ⚠️  Could not generate MENA analysis\n"
+                sys.stdout.write(report)
+        
+        return confirmed_news
+    finally:
+        if openai_client:
+            await openai_client.close()
 
 
-def fetch_yesterdays_funding_news(use_llm: bool = True, run_mena: bool = False):
-    """Fetch funding news from yesterday with optional LLM classification."""
+def fetch_yesterdays_funding_news(use_llm: bool = True, run_mena: bool = False, use_cache: bool = True,
+                                  use_batch_api: bool = False):
+    """Fetch funding news from yesterday with optional LLM classification.
+    
+    use_batch_api sends LLM requests through the OpenAI Batch API: half the
+    price, but results can take up to 24 hours, so it suits unattended runs.
+    """
     yesterday = datetime.now() - timedelta(days=1)
     yesterday_start = yesterday.replace(hour=0, minute=0, second=0, microsecond=0)
     today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
@@ -558,7 +1583,7 @@ def fetch_yesterdays_funding_news(use_llm: bool = True, run_mena: bool = False):
     if use_llm and OPENAI_AVAILABLE:
         api_key = os.getenv("OPENAI_API_KEY")
         if api_key and not api_key.startswith("sk-your"):
-            openai_client = OpenAI(api_key=api_key)
+            openai_client = load_async_openai()(api_key=api_key)
             print("🤖 Using LLM-based classification for accurate detection\n")
         else:
             print("⚠️  No OPENAI_API_KEY set. Using keyword-based detection.")
@@ -566,6 +1591,13 @@ def fetch_yesterdays_funding_news(use_llm: bool = True, run_mena: bool = False):
     elif use_llm and not OPENAI_AVAILABLE:
         print("⚠️  OpenAI package not installed. Using keyword-based detection.\n")
     
+    cache = None
+    if openai_client and use_cache:
+        try:
+            cache = LLMResultCache()
+        except sqlite3.Error as e:
+            print(f"⚠️  Could not open result cache at {CACHE_PATH}: {e}\n")
+    
     print(f"{'=' * 60}")
     print(f"AI STARTUP FUNDING NEWS")
     print(f"Date: {yesterday.strftime('%B %d, %Y')}")
@@ -576,268 +1608,199 @@ def fetch_yesterdays_funding_news(use_llm: bool = True, run_mena: bool = False):
     candidates = []
     
     print("📡 Fetching from RSS feeds...")
-    for feed_name, feed_url in FEEDS:
-        try:
-            feed = feedparser.parse(feed_url)
-            
-            for entry in feed.entries:
-                # Parse published date
-                published_at = None
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    published_at = datetime(*entry.published_parsed[:6])
-                elif hasattr(entry, 'published'):
-                    try:
-                        published_at = date_parser.parse(entry.published)
-                    except:
-                        continue
-                
-                if not published_at:
-                    continue
-                
-                # Check if from yesterday
-                if not (yesterday_start <= published_at < today_start):
-                    continue
-                
-                title = entry.get('title', 'Untitled')
-                link = entry.get('link', '')
-                summary = clean_html(entry.get('summary', entry.get('description', '')))[:500]
-                
-                # Pre-filter: quick keyword check to reduce LLM calls
-                if not is_funding_related(title, summary):
-                    continue
-                
-                candidates.append({
-                    'source': feed_name,
-                    'title': title,
-                    'link': link,
-                    'summary': summary,
-                    'published': published_at,
-                })
-                
-        except Exception as e:
-            print(f"   Error fetching {feed_name}: {e}")
+    # Feed fetches are network-bound, so run them side by side; map() keeps
+    # FEEDS order so deduplication below still prefers earlier feeds
+    feed_session = create_http_session() if SCRAPING_AVAILABLE else None
+    with ThreadPoolExecutor(max_workers=FEED_FETCH_WORKERS) as executor:
+        feed_results = executor.map(
+            lambda feed: fetch_feed_candidates(feed[0], feed[1], yesterday_start, today_start, feed_session),
+            FEEDS
+        )
+        for feed_candidates in feed_results:
+            candidates.extend(feed_candidates)
+    if feed_session:
+        feed_session.close()
     
     print(f"   Found {len(candidates)} potential articles\n")
     
     # Remove duplicates by title similarity
-    seen_titles = set()
-    unique_candidates = []
-    for item in candidates:
-        title_key = item['title'].lower()[:50]
-        if title_key not in seen_titles:
-            seen_titles.add(title_key)
-            unique_candidates.append(item)
+    unique_candidates = deduplicate_candidates(candidates)
     
     print(f"   {len(unique_candidates)} unique articles after deduplication\n")
     
-    # Second pass: classify with LLM or keywords
-    confirmed_news = []
-    rejected_count = 0
-    
-    # Check for debug mode (set in main block)
-    debug_mode = globals().get('DEBUG_MODE', False)
+    return asyncio.run(classify_and_report(unique_candidates, openai_client, cache, run_mena, use_batch_api))
+
+
+# Report text for one article in export_to_txt; rules come in as sep_eq/sep_dash
+ARTICLE_TEMPLATE_BASIC = """
+{sep_eq}
+#{i} {item[title]}
+{sep_eq}
+
+FUNDING DETAILS
+{sep_dash}
+Company: {company}
+Amount: {amount}
+Round: {round_type}
+Source: {item[source]}
+Link: {item[link]}
+Published: {published}
+
+Summary:
+{item[summary]}
+
+"""
+
+# Appended for articles that have a MENA analysis
+MENA_SECTION_TEMPLATE = """MENA MARKET ANALYSIS
+{sep_dash}
+
+1. INNOVATION SUMMARY
+   Type: {a.innovation_type}
+   {a.innovation_summary}
+
+2. PROBLEM-SOLUTION FIT IN MENA
+   {a.problem_solution_fit}
+   Target Sectors: {a.target_sectors_str}
+   Vision 2030 Alignment: {a.vision_2030_alignment}
+
+3. LOCALIZABILITY SCORECARD
+   Arabic Complexity: {a.arabic_complexity}
+     - {a.arabic_complexity_notes}
+   Regulatory Fit: {a.regulatory_fit}
+     - {a.regulatory_fit_notes}
+   Market Readiness: {a.market_readiness}
+     - {a.market_readiness_notes}
+   Infrastructure Fit: {a.infrastructure_fit}
+     - {a.infrastructure_fit_notes}
+
+4. COMMERCIAL BUYER MAP
+   Potential Buyers: {a.potential_buyers_str}
+   Sales Motion: {a.sales_motion}
+
+5. OPPORTUNITY RATING
+   Commercialization Potential: {a.commercialization_potential}
+   Localization Requirement: {a.localization_requirement}
+   Priority: {a.priority}
+
+6. JUSTIFICATION
+   {a.justification}
+
+"""
+
+ARTICLE_TEMPLATE_WITH_MENA = ARTICLE_TEMPLATE_BASIC + MENA_SECTION_TEMPLATE
+
+
+def export_to_txt(results: List[Dict[str, Any]], filename: str):
+    """Export results to a formatted text file.
     
-    if openai_client:
-        print("🔍 Classifying articles with LLM...\n")
-        for i, item in enumerate(unique_candidates):
-            classification = classify_with_llm(item['title'], item['summary'], openai_client, verbose=True, debug=debug_mode)
-            
-            if classification.is_fundraising and classification.confidence >= 0.6:
-                item['classification'] = classification
-                item['amount'] = classification.amount or extract_amount(f"{item['title']} {item['summary']}")
-                item['company'] = classification.company_name
-                item['round_type'] = classification.round_type
-                item['confidence'] = classification.confidence
-                confirmed_news.append(item)
-            else:
-                rejected_count += 1
+    Sections are written straight to the file as they are rendered; the
+    large write buffer turns them into a few big writes.
+    """
+    with open(filename, 'w', buffering=EXPORT_BUFFER_SIZE) as f:
+        # Header and summary
+        yesterday = datetime.now() - timedelta(days=1)
+        f.write(
+            f"{SEP_EQ}\n"
+            "MENA SIGNAL - AI STARTUP FUNDING REPORT\n"
+            f"Date: {yesterday.strftime('%B %d, %Y')}\n"
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"{SEP_EQ}\n"
+            "\n"
+            "EXECUTIVE SUMMARY\n"
+            f"{SEP_DASH}\n"
+            f"Total Funding News Found: {len(results)}\n"
+        )
         
-        print(f"\n   ✅ Accepted: {len(confirmed_news)} | ❌ Rejected: {rejected_count}\n")
-    else:
-        # Keyword-based fallback
-        print("🔍 Classifying articles with keywords...")
-        for item in unique_candidates:
-            classification = classify_with_keywords(item['title'], item['summary'])
-            
-            if classification.is_fundraising and classification.confidence >= 0.5:
-                item['classification'] = classification
-                item['amount'] = classification.amount or extract_amount(f"{item['title']} {item['summary']}")
-                item['company'] = classification.company_name
-                item['round_type'] = classification.round_type
-                item['confidence'] = classification.confidence
-                confirmed_news.append(item)
-        
-        print(f"   Classification complete!\n")
-    
-    # Sort by confidence, then published time
-    confirmed_news.sort(key=lambda x: (-x.get('confidence', 0), x['published']), reverse=False)
-    confirmed_news.sort(key=lambda x: x['published'], reverse=True)
-    
-    if not confirmed_news:
-        print("❌ No AI startup funding news found from yesterday.")
-        print("\n💡 Tips:")
-        print("   - Try running this script on a weekday for more results")
-        print("   - Set OPENAI_API_KEY for better classification accuracy")
-        return []
-    
-    print(f"✅ Found {len(confirmed_news)} confirmed funding news items:\n")
-    print("-" * 60)
-    
-    for i, item in enumerate(confirmed_news, 1):
-        # Build info string
-        info_parts = []
-        if item.get('amount'):
-            info_parts.append(item['amount'])
-        if item.get('round_type'):
-            info_parts.append(item['round_type'])
-        if item.get('confidence'):
-            info_parts.append(f"{int(item['confidence'] * 100)}% conf")
-        
-        info_str = f" [{', '.join(info_parts)}]" if info_parts else ""
-        
-        print(f"{i}. {item['title']}{info_str}")
-        if item.get('company'):
-            print(f"   🏢 Company: {item['company']}")
-        print(f"   📰 Source: {item['source']}")
-        print(f"   🔗 {item['link']}")
-        if item['summary']:
-            print(f"   📝 {item['summary'][:150]}...")
-        print()
-    
-    # Run MENA analysis if requested
-    if run_mena and confirmed_news and openai_client:
-        print("\n" + "=" * 60)
-        print("🌍 RUNNING MENA MARKET ANALYSIS")
-        print("=" * 60)
-        
-        if not SCRAPING_AVAILABLE:
-            print("\n⚠️  Web scraping not available. Install with: pip install requests beautifulsoup4")
-            print("   Using RSS summaries instead of full article content.\n")
+        # One pass for both "any MENA analysis?" and the high-priority count
+        has_mena = False
+        high_priority = 0
+        for item in results:
+            analysis = item.get('mena_analysis')
+            if analysis is None:
+                continue
+            has_mena = True
+            if 'prototyping' in analysis.priority.casefold():
+                high_priority += 1
+        if has_mena:
+            f.write(f"High Priority (Worth Prototyping): {high_priority}\n")
+        f.write("\n")
         
-        for i, item in enumerate(confirmed_news, 1):
-            print(f"\n📄 Fetching article {i}/{len(confirmed_news)}: {item['title'][:50]}...")
-            
-            # Try to fetch full article content
-            full_content = None
-            if SCRAPING_AVAILABLE:
-                full_content = fetch_article_content(item['link'])
-            
-            # Use RSS summary as fallback
-            content = full_content if full_content else item['summary']
-            content_source = "full article" if full_content else "RSS summary"
-            print(f"   Using {content_source} ({len(content)} chars)")
-            
-            # Run MENA analysis
-            print(f"   🔍 Analyzing MENA potential...")
-            analysis = run_mena_analysis(item['title'], content, openai_client)
-            
-            if analysis:
-                item['mena_analysis'] = analysis
-                print_mena_analysis(item, analysis, i)
+        # Each article, rendered from one template
+        for i, item in enumerate(results, 1):
+            fields = {
+                'i': i,
+                'item': item,
+                'company': item.get('company', 'Unknown'),
+                'amount': item.get('amount', 'Undisclosed'),
+                'round_type': item.get('round_type', 'Unknown'),
+                'published': item.get('published_date') or item['published'].strftime('%Y-%m-%d'),
+                'sep_eq': SEP_EQ,
+                'sep_dash': SEP_DASH,
+            }
+            analysis = item.get('mena_analysis')
+            if analysis is not None:
+                f.write(ARTICLE_TEMPLATE_WITH_MENA.format(a=analysis, **fields))
             else:
-                print(f"   ⚠️  Could not generate MENA analysis")
-    
-    return confirmed_news
+                f.write(ARTICLE_TEMPLATE_BASIC.format(**fields))
+        
+        # Footer
+        f.write(f"\n{SEP_EQ}\nEND OF REPORT\n{SEP_EQ}")
 
 
-def export_to_txt(results: List[Dict[str, Any]], filename: str):
-    """Export results to a formatted text file."""
-    lines = []
-    
-    # Header
-    yesterday = datetime.now() - timedelta(days=1)
-    lines.append("=" * 80)
-    lines.append("MENA SIGNAL - AI STARTUP FUNDING REPORT")
-    lines.append(f"Date: {yesterday.strftime('%B %d, %Y')}")
-    lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("=" * 80)
-    lines.append("")
-    
-    # Summary
-    lines.append(f"EXECUTIVE SUMMARY")
-    lines.append("-" * 40)
-    lines.append(f"Total Funding News Found: {len(results)}")
-    
-    if any('mena_analysis' in item for item in results):
-        high_priority = sum(1 for item in results if 'mena_analysis' in item and 'prototyping' in item['mena_analysis'].priority.lower())
-        lines.append(f"High Priority (Worth Prototyping): {high_priority}")
-    lines.append("")
-    
-    # Each article
-    for i, item in enumerate(results, 1):
-        lines.append("")
-        lines.append("=" * 80)
-        lines.append(f"#{i} {item['title']}")
-        lines.append("=" * 80)
-        lines.append("")
-        
-        # Basic info
-        lines.append("FUNDING DETAILS")
-        lines.append("-" * 40)
-        lines.append(f"Company: {item.get('company', 'Unknown')}")
-        lines.append(f"Amount: {item.get('amount', 'Undisclosed')}")
-        lines.append(f"Round: {item.get('round_type', 'Unknown')}")
-        lines.append(f"Source: {item['source']}")
-        lines.append(f"Link: {item['link']}")
-        lines.append(f"Published: {item['published'].strftime('%Y-%m-%d')}")
-        lines.append("")
-        lines.append("Summary:")
-        lines.append(item['summary'])
-        lines.append("")
-        
-        # MENA Analysis if present
-        if 'mena_analysis' in item:
-            analysis = item['mena_analysis']
-            
-            lines.append("MENA MARKET ANALYSIS")
-            lines.append("-" * 40)
-            lines.append("")
-            
-            lines.append("1. INNOVATION SUMMARY")
-            lines.append(f"   Type: {analysis.innovation_type}")
-            lines.append(f"   {analysis.innovation_summary}")
-            lines.append("")
-            
-            lines.append("2. PROBLEM-SOLUTION FIT IN MENA")
-            lines.append(f"   {analysis.problem_solution_fit}")
-            lines.append(f"   Target Sectors: {', '.join(analysis.target_sectors)}")
-            lines.append(f"   Vision 2030 Alignment: {analysis.vision_2030_alignment}")
-            lines.append("")
-            
-            lines.append("3. LOCALIZABILITY SCORECARD")
-            lines.append(f"   Arabic Complexity: {analysis.arabic_complexity}")
-            lines.append(f"     - {analysis.arabic_complexity_notes}")
-            lines.append(f"   Regulatory Fit: {analysis.regulatory_fit}")
-            lines.append(f"     - {analysis.regulatory_fit_notes}")
-            lines.append(f"   Market Readiness: {analysis.market_readiness}")
-            lines.append(f"     - {analysis.market_readiness_notes}")
-            lines.append(f"   Infrastructure Fit: {analysis.infrastructure_fit}")
-            lines.append(f"     - {analysis.infrastructure_fit_notes}")
-            lines.append("")
-            
-            lines.append("4. COMMERCIAL BUYER MAP")
-            lines.append(f"   Potential Buyers: {', '.join(analysis.potential_buyers)}")
-            lines.append(f"   Sales Motion: {analysis.sales_motion}")
-            lines.append("")
-            
-            lines.append("5. OPPORTUNITY RATING")
-            lines.append(f"   Commercialization Potential: {analysis.commercialization_potential}")
-            lines.append(f"   Localization Requirement: {analysis.localization_requirement}")
-            lines.append(f"   Priority: {analysis.priority}")
-            lines.append("")
-            
-            lines.append("6. JUSTIFICATION")
-            lines.append(f"   {analysis.justification}")
-            lines.append("")
+def item_to_export(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the JSON export dict for a result in one literal."""
+    base = {
+        'title': item['title'],
+        'company': item.get('company'),
+        'amount': item.get('amount'),
+        'round_type': item.get('round_type'),
+        'source': item['source'],
+        'link': item['link'],
+        'summary': item['summary'],
+        'published': item.get('published_iso') or item['published'].isoformat(),
+        'confidence': item.get('confidence', 0)
+    }
+    analysis = item.get('mena_analysis')
+    if analysis is None:
+        return base
+    return {**base, 'mena_analysis': analysis.as_export_dict()}
+
+
+def export_to_json(results: List[Dict[str, Any]], filename: str, pretty: bool = False):
+    """Export results to a JSON file, compact unless pretty is set."""
+    export_data = list(map(item_to_export, results))
     
-    # Footer
-    lines.append("")
-    lines.append("=" * 80)
-    lines.append("END OF REPORT")
-    lines.append("=" * 80)
+    # Serialize up front; json.dump would issue a write per chunk
+    payload = dump_json(export_data, pretty)
+    with open(filename, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+        f.write(payload)
+
+
+# Exporter for each --export file extension; anything else is written as JSON
+EXPORTERS = {
+    '.txt': export_to_txt,
+    '.json': export_to_json,
+}
+
+
+def export_results(results: List[Dict[str, Any]], filename: str, pretty: bool = False):
+    """Export results to a file, picking the format from its extension.
     
-    with open(filename, 'w') as f:
-        f.write('\n'.join(lines))
+    Only the JSON exporter takes pretty; the text report is always laid out
+    for reading.
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    exporter = EXPORTERS.get(extension, export_to_json)
+    if exporter is export_to_json:
+        exporter = functools.partial(export_to_json, pretty=pretty)
+    exporter(results, filename)
+
+
+def export_all(results: List[Dict[str, Any]], filenames: List[str], pretty: bool = False):
+    """Export results to every file in turn."""
+    for filename in filenames:
+        export_results(results, filename, pretty)
 
 
 if __name__ == "__main__":
@@ -846,70 +1809,29 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Fetch yesterday's AI startup funding news")
     parser.add_argument("--no-llm", action="store_true", help="Disable LLM classification (use keywords only)")
     parser.add_argument("--mena", action="store_true", help="Run MENA market analysis on filtered articles")
-    parser.add_argument("--export", type=str, help="Export results to file (.txt or .json based on extension)")
+    parser.add_argument("--export", type=str, action="append",
+                        help="Export results to file (.txt or .json based on extension); repeat for several files")
+    parser.add_argument("--pretty", action="store_true", help="Indent JSON exports (compact by default)")
     parser.add_argument("--debug", action="store_true", help="Enable debug output for LLM responses")
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write the on-disk LLM result cache")
+    parser.add_argument("--batch", action="store_true",
+                        help="Send LLM requests through the OpenAI Batch API (50%% cheaper, may take up to 24h)")
     args = parser.parse_args()
     
     # Store debug flag globally for use in classification
     DEBUG_MODE = args.debug
     
-    results = fetch_yesterdays_funding_news(use_llm=not args.no_llm, run_mena=args.mena)
+    results = fetch_yesterdays_funding_news(
+        use_llm=not args.no_llm,
+        run_mena=args.mena,
+        use_cache=not args.no_cache,
+        use_batch_api=args.batch
+    )
     
     if args.export and results:
-        # Determine export format by file extension
-        if args.export.endswith('.txt'):
-            export_to_txt(results, args.export)
-            print(f"\n📁 Report exported to {args.export}")
-        else:
-            # Export to JSON (default)
-            export_data = []
-            for item in results:
-                item_data = {
-                    'title': item['title'],
-                    'company': item.get('company'),
-                    'amount': item.get('amount'),
-                    'round_type': item.get('round_type'),
-                    'source': item['source'],
-                    'link': item['link'],
-                    'summary': item['summary'],
-                    'published': item['published'].isoformat(),
-                    'confidence': item.get('confidence', 0)
-                }
-                
-                # Include MENA analysis if present
-                if 'mena_analysis' in item:
-                    analysis = item['mena_analysis']
-                    item_data['mena_analysis'] = {
-                        'innovation_summary': analysis.innovation_summary,
-                        'innovation_type': analysis.innovation_type,
-                        'problem_solution_fit': analysis.problem_solution_fit,
-                        'target_sectors': analysis.target_sectors,
-                        'vision_2030_alignment': analysis.vision_2030_alignment,
-                        'localizability': {
-                            'arabic_complexity': analysis.arabic_complexity,
-                            'arabic_notes': analysis.arabic_complexity_notes,
-                            'regulatory_fit': analysis.regulatory_fit,
-                            'regulatory_notes': analysis.regulatory_fit_notes,
-                            'market_readiness': analysis.market_readiness,
-                            'market_notes': analysis.market_readiness_notes,
-                            'infrastructure_fit': analysis.infrastructure_fit,
-                            'infrastructure_notes': analysis.infrastructure_fit_notes
-                        },
-                        'commercial': {
-                            'potential_buyers': analysis.potential_buyers,
-                            'sales_motion': analysis.sales_motion
-                        },
-                        'opportunity': {
-                            'commercialization_potential': analysis.commercialization_potential,
-                            'localization_requirement': analysis.localization_requirement,
-                            'priority': analysis.priority
-                        },
-                        'justification': analysis.justification
-                    }
-                
-                export_data.append(item_data)
-            
-            with open(args.export, 'w') as f:
-                json.dump(export_data, f, indent=2)
-            print(f"\n📁 Results exported to {args.export}")
+        # A file named twice is written once
+        filenames = list(dict.fromkeys(args.export))
+        export_all(results, filenames, pretty=args.pretty)
+        for filename in filenames:
+            print(f"\n📁 Results exported to {filename}")
 